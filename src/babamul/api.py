@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
 import logging
 import os
@@ -22,12 +23,37 @@ from .models import (
     ObjPhotometry,
     UserProfile,
     ZtfAlert,
+    _dict_adapter,
+    _list_adapter,
 )
 
 logger = logging.getLogger(__name__)
 
 Survey = Literal["ZTF", "LSST"]
 
+# Shared pooled client behind the module-level get_* functions: keep-alive
+# amortizes the TCP+TLS handshake across calls to the same host instead of
+# paying it per request. Created lazily so importing the module stays free
+# of network resources.
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        limits = httpx.Limits(
+            max_keepalive_connections=20, max_connections=100
+        )
+        try:
+            # HTTP/2 multiplexes concurrent requests (e.g. the threaded
+            # cutout fetches) over one connection; needs the h2 package
+            # pulled in via the httpx[http2] extra.
+            _client = httpx.Client(http2=True, limits=limits, timeout=30.0)
+        except ImportError:
+            _client = httpx.Client(limits=limits, timeout=30.0)
+        atexit.register(_client.close)
+    return _client
+
 
 def _resolve_token() -> str:
     """Resolve the API token from environment variable.
@@ -87,13 +113,12 @@ def _request(
     }
 
     try:
-        response = httpx.request(
+        response = _get_client().request(
             method,
             url,
             params=params,
             json=json,
             headers=headers,
-            timeout=30.0,
         )
     except httpx.RequestError as e:
         raise APIError(f"Request failed: {e}") from e
@@ -205,7 +230,7 @@ def get_alerts(
     response = _request("GET", f"/surveys/{survey}/alerts", params=params)
     data = response.get("data", [])
     alert_model = ZtfAlert if survey == "ZTF" else LsstAlert
-    return [alert_model.model_validate(alert) for alert in data]
+    return cast(list[ZtfAlert | LsstAlert], alert_model.validate_many(data))
 
 
 def cone_search_alerts(
@@ -403,9 +428,7 @@ def cone_search_alerts(
                 data = response.get("data", [])
                 alert_model = ZtfAlert if survey == "ZTF" else LsstAlert
                 for name, alerts in data.items():
-                    results[name] = [
-                        alert_model.model_validate(alert) for alert in alerts
-                    ]
+                    results[name] = alert_model.validate_many(alerts)
             except Exception as e:
                 logger.error(f"Error processing cone search batch: {e}")
 
@@ -552,11 +575,9 @@ def cone_search_objects(
             try:
                 response = future.result()
                 data = response.get("data", {})
+                adapter = _list_adapter(ObjectSearchResult)
                 for name, objects in data.items():
-                    results[name] = [
-                        ObjectSearchResult.model_validate(obj)
-                        for obj in objects
-                    ]
+                    results[name] = adapter.validate_python(objects)
             except Exception as e:
                 logger.error(f"Error processing cone search batch: {e}")
     return results
@@ -723,8 +744,11 @@ def get_cross_matches_bulk(
             try:
                 response = future.result()
                 data = response.get("data", {})
-                for obj_id, cm in data.items():
-                    results[obj_id] = CrossMatches.model_validate(cm)
+                # validate the whole objectId -> cross-matches mapping in
+                # one call against the cached adapter
+                results.update(
+                    _dict_adapter(CrossMatches).validate_python(data)
+                )
             except Exception as e:
                 logger.error(f"Error fetching cross-matches batch: {e}")
     return results
@@ -753,7 +777,10 @@ def search_objects(
         params={"object_id": object_id, "limit": min(max(1, limit), 100)},
     )
     data = response.get("data", [])
-    return [ObjectSearchResult.model_validate(obj) for obj in data]
+    return cast(
+        list[ObjectSearchResult],
+        _list_adapter(ObjectSearchResult).validate_python(data),
+    )
 
 
 def get_profile() -> UserProfile:
@@ -1,10 +1,16 @@
 """Avro deserialization utilities for Babamul alerts."""
 
 import io
+import logging
 from typing import Any, cast
 
 import fastavro
 
+logger = logging.getLogger(__name__)
+
+# Warn about per-message Avro compression only once per process
+_warned_compressed_codec = False
+
 
 def deserialize_alert(data: bytes) -> dict[str, Any]:
     """Deserialize an Avro-encoded Babamul alert.
@@ -24,6 +30,17 @@ def deserialize_alert(data: bytes) -> dict[str, Any]:
     fastavro._reader.SchemaResolutionError
         If the data cannot be deserialized due to schema mismatch.
     """
+    global _warned_compressed_codec
     reader = fastavro.reader(io.BytesIO(data))
+    if reader.codec != "null" and not _warned_compressed_codec:
+        # Each message is a tiny single-record container, so a per-message
+        # codec buys little and costs a decompression call per alert;
+        # compression is better handled at the Kafka layer across batches
+        logger.warning(
+            f"Alert payload uses Avro codec '{reader.codec}'; "
+            "per-message decompression adds overhead for single-record "
+            "containers (prefer broker-side compression.type instead)"
+        )
+        _warned_compressed_codec = True
     result = cast(dict[str, Any], next(reader))
     return result
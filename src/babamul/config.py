@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 KAFKA_SERVERS = {
     "local": "localhost:9093",
@@ -26,10 +27,15 @@ def _get_env() -> str:
     return env
 
 
+@lru_cache(maxsize=1)
 def get_base_url() -> str:
     """Get the API base URL based on the BABAMUL_ENV environment variable.
 
     Returns the URL for "local", "backup" or "production" (default).
+
+    The result is cached after the first call, so BABAMUL_ENV must be set
+    before any API request is made (use ``get_base_url.cache_clear()`` to
+    re-read it).
     """
     return API_URLS[_get_env()]
 
@@ -2,9 +2,6 @@
 
 from typing import Any
 
-from IPython.display import display
-from ipywidgets import widgets
-
 from babamul.models import LsstAlert, ZtfAlert
 
 
@@ -13,6 +10,19 @@ def scan_alerts(
     include_survey_matches: bool = True,
     include_nondetections: bool = True,
 ) -> None:
+    # Imported here so that importing this module (e.g. via tooling that
+    # walks the package) stays cheap and does not require the optional
+    # jupyter extra; the cost is paid once on the first scan_alerts call.
+    import contextlib
+    import io
+
+    import matplotlib.pyplot as plt
+    from IPython.display import (  # type: ignore[attr-defined]
+        Image,
+        display,
+    )
+    from ipywidgets import widgets
+
     # Create buttons and output area
     prev_button = widgets.Button(description="← Previous")
     next_button = widgets.Button(description="Next →")
@@ -32,6 +42,53 @@ def scan_alerts(
     # State
     current_idx = [0]
 
+    # Reuse a single figure across navigation: allocating a fresh figure
+    # (and its canvas) per alert dominates prev/next latency
+    fig = plt.figure(figsize=(12, 6))
+
+    # Rendered PNGs keyed by (candid, toggles). Displaying cached bytes
+    # is O(1), so revisits and prefetched neighbors skip the matplotlib
+    # redraw entirely. Bounded FIFO eviction keeps memory in check.
+    png_cache: dict[tuple[Any, bool, bool], bytes] = {}
+    PNG_CACHE_SIZE = 64
+
+    def render_png(idx: int) -> bytes:
+        alert: ZtfAlert | LsstAlert = alerts[idx]
+        key = (
+            alert.candid,
+            survey_matches_toggle.value,
+            nondetections_toggle.value,
+        )
+        png = png_cache.get(key)
+        if png is None:
+            alert.show(
+                include_survey_matches=survey_matches_toggle.value,
+                include_nondetections=nondetections_toggle.value,
+                fig=fig,
+                show=False,
+            )
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png")
+            png = buf.getvalue()
+            if len(png_cache) >= PNG_CACHE_SIZE:
+                png_cache.pop(next(iter(png_cache)))
+            png_cache[key] = png
+        return png
+
+    def prefetch_neighbors() -> None:
+        # Render the predictable prev/next targets into the cache while
+        # the user reads the current alert. The kernel handles widget
+        # messages sequentially (and matplotlib is not thread-safe), so
+        # this runs between clicks rather than on a background thread —
+        # by the next arrow click the PNG is usually already cached.
+        idx = current_idx[0]
+        for neighbor in (idx + 1, idx - 1):
+            if 0 <= neighbor < len(alerts):
+                # best-effort: a broken neighbor will surface its error
+                # when actually navigated to
+                with contextlib.suppress(Exception):
+                    render_png(neighbor)
+
     def update_display() -> None:
         if len(alerts) == 0:
             info_label.value = "No alerts found"
@@ -46,15 +103,16 @@ def scan_alerts(
         with output:
             output.clear_output(wait=True)
             try:
-                alert.show(
-                    include_survey_matches=survey_matches_toggle.value,
-                    include_nondetections=nondetections_toggle.value,
-                )  # This will display the cutouts and metadata
+                image = Image(  # type: ignore[no-untyped-call]
+                    data=render_png(idx)
+                )
+                display(image)  # type: ignore[no-untyped-call]
             except Exception as e:
                 print(f"Error displaying alert: {e}")
             # let's also show a clickable link to the alert on the Babamul web interface
             alert_url = f"https://babamul.caltech.edu/objects/{alert.survey}/{alert.objectId}"
             print(f"View on Babamul: {alert_url}")
+        prefetch_neighbors()
 
     def on_prev(b: Any) -> None:
         if current_idx[0] > 0:
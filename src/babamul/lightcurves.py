@@ -1,7 +1,10 @@
+import sys
+from collections.abc import Callable
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -17,6 +20,8 @@ band_colors = {
     "u": "blue",
 }
 
+DEFAULT_BAND_COLOR = "gray"
+
 surveys = ["ztf", "lsst"]
 
 SNR_THRESHOLD = 3
@@ -30,11 +35,29 @@ def get_key_from_any(data: Any, key: str, default: Any = None) -> Any:
         return getattr(data, key, default)
 
 
+# Per-type normalizer cache so the isinstance check runs once per type
+# rather than once per row when normalizing whole band columns
+_band_normalizers: dict[type, "Callable[[Any], str]"] = {}
+
+
 def _normalize_band(band: Any) -> str:
-    """Normalize a band value to a plain string, handling Enum instances."""
-    if isinstance(band, Enum):
-        return band.value
-    return str(band)
+    """Normalize a band value to a plain interned string.
+
+    Band enum members are singletons with cached hashes, but raw dict
+    alerts carry fresh str objects from JSON parsing; interning them
+    makes the per-band grouping hash/compare against a small vocabulary
+    of shared objects.
+    """
+    normalizer = _band_normalizers.get(type(band))
+    if normalizer is None:
+        if isinstance(band, Enum):
+            normalizer = lambda b: sys.intern(str(b.value))  # noqa: E731
+        elif type(band) is str:
+            normalizer = sys.intern
+        else:
+            normalizer = lambda b: sys.intern(str(b))  # noqa: E731
+        _band_normalizers[type(band)] = normalizer
+    return normalizer(band)
 
 
 # to avoid duplication, let's write some helper functions that prepare the data for each type of lightcurve
@@ -149,6 +172,20 @@ def plot_lightcurve(
         Whether to display the plot immediately. Default is True.
     """
 
+    # For pydantic models, dump the fields we actually read into a plain
+    # dict once, so every get_key_from_any call below takes the dict fast
+    # path instead of going through getattr per field
+    if hasattr(alert, "model_dump"):
+        alert = alert.model_dump(
+            include={
+                "objectId",
+                "prv_candidates",
+                "prv_nondetections",
+                "fp_hists",
+                "survey_matches",
+            }
+        )
+
     # Combine current and previous detections
     all_detections = []
 
@@ -158,29 +195,74 @@ def plot_lightcurve(
     if include_survey_matches:
         all_detections.extend(get_survey_matches(alert))
 
-    df = pd.DataFrame(all_detections)
-    if not df.empty:
-        df["band"] = df["band"].apply(_normalize_band)
     if not include_nondetections:
-        df = df[~df["lim"]]
+        all_detections = [d for d in all_detections if not d["lim"]]
 
     # Plot
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 6))
 
-    for band in df["band"].unique():
-        band_data = df[df["band"] == band]
-        detections = band_data[~band_data["lim"]]
-        limits = band_data[band_data["lim"]]
+    if not all_detections:
+        # Nothing to plot: skip the DataFrame machinery entirely
+        ax.text(
+            0.5,
+            0.5,
+            "No photometry available",
+            ha="center",
+            va="center",
+            transform=ax.transAxes,
+        )
+        ax.set_xlabel("MJD", fontsize=12)
+        ax.set_ylabel("AB Mag", fontsize=12)
+        if show:
+            plt.tight_layout()
+            plt.show()
+        return
+
+    # Bucket rows by band in a single pass rather than re-scanning a full
+    # DataFrame with a boolean mask for every unique band. For a handful of
+    # points, plain dict bucketing avoids the DataFrame setup cost entirely.
+    # values are (mjd, mag, magerr, lim) columns, either plain lists or
+    # pandas Series depending on the branch below
+    band_groups: dict[str, tuple[Any, Any, Any, Any]]
+    if len(all_detections) < 8:
+        band_groups = {}
+        for d in all_detections:
+            mjds, mags, magerrs, lims = band_groups.setdefault(
+                _normalize_band(d["band"]), ([], [], [], [])
+            )
+            mjds.append(d["mjd"])
+            mags.append(d["mag"])
+            magerrs.append(d["magerr"])
+            lims.append(d["lim"])
+    else:
+        df = pd.DataFrame(all_detections)
+        df["band"] = df["band"].map(_normalize_band)
+        band_groups = {
+            str(band): (
+                band_data["mjd"],
+                band_data["mag"],
+                band_data["magerr"],
+                band_data["lim"],
+            )
+            for band, band_data in df.groupby("band", sort=False)
+        }
+
+    for band, (mjd_col, mag_col, magerr_col, lim_col) in band_groups.items():
+        mjd = np.asarray(mjd_col, dtype=float)
+        mag = np.asarray(mag_col, dtype=float)
+        magerr = np.asarray(magerr_col, dtype=float)
+        lim_mask = np.asarray(lim_col, dtype=bool)
 
-        color = band_colors.get(band, "gray")
+        color = band_colors.get(band, DEFAULT_BAND_COLOR)
 
         # Plot detections
-        if len(detections) > 0:
+        if not lim_mask.all():
+            det_mask = ~lim_mask
             ax.errorbar(
-                detections["mjd"],
-                detections["mag"],
-                yerr=detections["magerr"],
+                mjd[det_mask],
+                mag[det_mask],
+                yerr=magerr[det_mask],
                 fmt="o",
                 color=color,
                 label=f"{band}-band",
@@ -189,10 +271,10 @@ def plot_lightcurve(
             )
 
         # Plot upper limits
-        if len(limits) > 0:
+        if lim_mask.any():
             ax.scatter(
-                limits["mjd"],
-                limits["mag"],
+                mjd[lim_mask],
+                mag[lim_mask],
                 marker="v",
                 color=color,
                 alpha=0.3,
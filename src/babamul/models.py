@@ -1,25 +1,71 @@
 """Pydantic models for Babamul alerts."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timezone
-from typing import TYPE_CHECKING, cast
+from functools import cache
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
-import matplotlib.pyplot as plt
 from astropy.time import Time
-from pydantic import AliasChoices, BaseModel, Field, computed_field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    TypeAdapter,
+    model_validator,
+)
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
-from .cutouts import plot_cutouts
-from .lightcurves import plot_lightcurve
 from .raw_models import (
+    Band,
     EnrichedLsstAlert,
     EnrichedZtfAlert,
     LsstCandidate,
     Photometry,
+    PhotometryArray,
     ZtfCandidate,
+    photometry_jds_to_datetimes,
 )
 
+# C-implemented sort key shared by the photometry sort paths; built once
+# so hot loops do not re-create it per call
+_JD_KEY = attrgetter("jd")
+
+
+def _is_sorted_jd(
+    photometry: list[Photometry], require_unique_keys: bool = False
+) -> bool:
+    """Check in one scan whether *photometry* is sorted by jd.
+
+    With ``require_unique_keys``, also verify that no (jd, band) key
+    repeats; in a jd-sorted list duplicates are confined to runs of
+    equal jd, so the check stays a single pass.
+    """
+    prev_jd = -math.inf
+    prev_band = None
+    run_bands: set[Band | None] | None = None
+    for p in photometry:
+        jd = p.jd
+        if jd < prev_jd:
+            return False
+        if require_unique_keys and jd == prev_jd:
+            if run_bands is None:
+                run_bands = {prev_band}
+            if p.band in run_bands:
+                return False
+            run_bands.add(p.band)
+        else:
+            run_bands = None
+        prev_jd = jd
+        prev_band = p.band
+    return True
+
+
 __all__ = [
     "AlertCutouts",
     "CrossMatches",
@@ -38,6 +84,9 @@ __all__ = [
 ]
 
 # --- API response models ---
+# All models defer pydantic-core schema construction to first use
+# (defer_build), so importing this module does not pay for building
+# validators for models a session never instantiates.
 
 
 class AlertCutouts(BaseModel):
@@ -48,12 +97,14 @@ class AlertCutouts(BaseModel):
     cutoutTemplate: bytes
     cutoutDifference: bytes
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"arbitrary_types_allowed": True, "defer_build": True}
 
 
 class ObjPhotometry(BaseModel):
     """Photometry data for an object."""
 
+    model_config = {"defer_build": True}
+
     objectId: str = Field(
         ..., validation_alias=AliasChoices("objectId", "object_id")
     )
@@ -65,6 +116,8 @@ class ObjPhotometry(BaseModel):
 class ObjectSearchResult(BaseModel):
     """Result from object search."""
 
+    model_config = {"defer_build": True}
+
     objectId: str
     ra: float
     dec: float
@@ -74,13 +127,21 @@ class ObjectSearchResult(BaseModel):
 class UserProfile(BaseModel):
     """User profile information."""
 
+    model_config = {"defer_build": True}
+
     id: str = Field(..., validation_alias=AliasChoices("id", "_id"))
     username: str
     email: str
     created_at: int
 
 
+# The match records below are write-once after deserialization, so they
+# are frozen: pydantic skips per-field __setattr__ validation and uses a
+# lighter instance layout, which matters when a batch materializes
+# thousands of them.
 class NedMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     objname: str | None = Field(
         None, validation_alias=AliasChoices("objname", "obj_name", "_id")
     )
@@ -99,6 +160,8 @@ class NedMatch(BaseModel):
 
 
 class CatwiseMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     source_name: str
     ra: float
     dec: float
@@ -119,6 +182,8 @@ class CatwiseMatch(BaseModel):
 
 
 class VsxMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     name: str
     var_flag: str | int | None = None
     ra: float
@@ -136,6 +201,8 @@ class VsxMatch(BaseModel):
 
 
 class MilliquasarMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     _id: str
     ra: float
     dec: float
@@ -143,6 +210,8 @@ class MilliquasarMatch(BaseModel):
 
 
 class GaiaMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     id: int | str = Field(..., validation_alias=AliasChoices("id", "_id"))
     ra: float
     dec: float
@@ -165,6 +234,8 @@ class GaiaMatch(BaseModel):
 
 
 class LSPSCMatch(BaseModel):
+    model_config = {"defer_build": True, "frozen": True}
+
     id: int | str = Field(..., validation_alias=AliasChoices("id", "_id"))
     ra: float
     dec: float
@@ -176,98 +247,260 @@ class LSPSCMatch(BaseModel):
 class CrossMatches(BaseModel):
     """Cross-matches with other surveys."""
 
-    # survey name -> list of matches
-    ned: list[NedMatch] | None = Field(
-        [], validation_alias=AliasChoices("ned", "NED")
+    model_config = {"defer_build": True}
+
+    # survey name -> list of matches; "no matches" is always an empty
+    # list, never None, so readers need no None-check
+    ned: list[NedMatch] = Field(
+        default_factory=list, validation_alias=AliasChoices("ned", "NED")
     )
-    catwise: list[CatwiseMatch] | None = Field(
-        [], validation_alias=AliasChoices("catwise", "CatWISE", "CatWISE2020")
+    catwise: list[CatwiseMatch] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("catwise", "CatWISE", "CatWISE2020"),
     )
-    vsx: list[VsxMatch] | None = Field(
-        [], validation_alias=AliasChoices("vsx", "VSX")
+    vsx: list[VsxMatch] = Field(
+        default_factory=list, validation_alias=AliasChoices("vsx", "VSX")
     )
-    milliquasar: list[MilliquasarMatch] | None = Field(
-        [],
+    milliquasar: list[MilliquasarMatch] = Field(
+        default_factory=list,
         validation_alias=AliasChoices(
             "milliquasar", "Milliquasar", "milliquas_v8"
         ),
     )
-    gaia: list[GaiaMatch] | None = Field(
-        [],
+    gaia: list[GaiaMatch] = Field(
+        default_factory=list,
         validation_alias=AliasChoices("gaia", "Gaia", "Gaia_DR3", "Gaia_EDR3"),
     )
-    lspsc: list[LSPSCMatch] | None = Field(
-        [],
+    lspsc: list[LSPSCMatch] = Field(
+        default_factory=list,
         validation_alias=AliasChoices(
             "lspsc", "LSPSC", "LegacySurveyPSCCatalog"
         ),
     )
 
-
-# here we just want to re-export the raw model we autogenerated from
-# avro using pydantic-avro, as the main model
+    @model_validator(mode="before")
+    @classmethod
+    def _none_to_empty(cls, data: Any) -> Any:
+        # the API may send an explicit null for a catalog with no
+        # matches; drop those keys so the defaults apply and the
+        # plain-list field shape above stays intact
+        if isinstance(data, dict) and None in data.values():
+            return {k: v for k, v in data.items() if v is not None}
+        return data
+
+
+@cache
+def _list_adapter(model: Any) -> "TypeAdapter[list[Any]]":
+    """Return a cached ``TypeAdapter(list[model])`` for batch validation.
+
+    Built lazily (rather than at module scope) so importing this module
+    does not pay for schema construction, in keeping with defer_build.
+    """
+    return TypeAdapter(list[model])
+
+
+@cache
+def _dict_adapter(model: Any) -> "TypeAdapter[dict[str, Any]]":
+    """Return a cached ``TypeAdapter(dict[str, model])``.
+
+    Used for API responses keyed by object ID, e.g. the bulk
+    cross-matches endpoint, so the whole mapping is validated in one
+    pydantic-core call against a validator built once per process.
+    """
+    return TypeAdapter(dict[str, model])
+
+
+# Precomputed figure layouts for show(): one straight-line dict lookup
+# per call instead of re-interpreting per-orientation branches. Each
+# entry gives the figure size, gridspec geometry, the cells holding the
+# three cutouts, and the cell holding the lightcurve.
+_SHOW_LAYOUTS: dict[str, dict[str, Any]] = {
+    "horizontal": {
+        "figsize": (12, 6),
+        "shape": (3, 2),
+        "width_ratios": [1, 2],
+        "height_ratios": [1, 1, 1],
+        "cutouts": [(0, 0), (1, 0), (2, 0)],
+        "lightcurve": (slice(None), 1),
+    },
+    "vertical": {
+        "figsize": (10, 10),
+        "shape": (2, 3),
+        "width_ratios": [1, 1, 1],
+        "height_ratios": [1, 2],
+        "cutouts": [(0, 0), (0, 1), (0, 2)],
+        "lightcurve": (1, slice(None)),
+    },
+}
+
+
+# here we just want to re-export the raw models we autogenerated from
+# avro using pydantic-avro, as the main models
 # to which we add extra functions, like a `get_photometry` accessor
 # that takes care of combining the different photometry sources
 # (prv_candidates, prv_nondetections, fp_hists)
-class ZtfAlert(EnrichedZtfAlert):
-    """Pydantic model for a Babamul ZTF alert."""
+class AlertDisplayMixin:
+    """Shared photometry access and display helpers for alert models.
+
+    ZtfAlert and LsstAlert only differ in which photometry sources they
+    carry, how those are fetched from the API, and a couple of display
+    defaults; everything else lives here once. Subclasses implement the
+    underscore-prefixed hooks.
+    """
+
+    # Whether plot_cutouts applies FITS-header rotation unless overridden
+    _use_rotation_default: ClassVar[bool] = False
+
+    if TYPE_CHECKING:
+        # Provided by the Enriched*Alert base models and subclasses
+        candid: int
+        objectId: str
+        survey: str
+        cutoutScience: bytes | None
+        cutoutTemplate: bytes | None
+        cutoutDifference: bytes | None
+        cross_matches: CrossMatches | None
+
+        # Provided by pydantic's BaseModel on the concrete classes
+        def model_dump(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    @classmethod
+    def validate_many(cls, raw: "list[dict[str, Any]]") -> "list[Any]":
+        """Validate a batch of raw alert dicts in a single pydantic call.
+
+        ``TypeAdapter(list[cls]).validate_python(raw)`` runs the whole
+        batch in one pydantic-core loop, avoiding the per-item overhead
+        of calling ``model_validate`` in a Python for-loop.
+        """
+        # mypy rejects the mixin class as the Hashable lru_cache key,
+        # but types are perfectly hashable at runtime
+        return _list_adapter(cls).validate_python(raw)  # type: ignore[arg-type]
+
+    # bytes fields that need base64 before JSON encoding
+    _CUTOUT_FIELDS: ClassVar[set[str]] = {
+        "cutoutScience",
+        "cutoutTemplate",
+        "cutoutDifference",
+    }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the alert to JSON bytes with orjson.
+
+        orjson's C-level encoder is several times faster than pydantic's
+        built-in JSON path on nested-list payloads like prv_candidates.
+        Cutout bytes are base64-encoded, matching the API convention.
+        """
+        import base64
 
-    topic: str | None = None
-    cross_matches: CrossMatches | None = None
+        import orjson
+
+        data = self.model_dump(
+            mode="json", by_alias=True, exclude=self._CUTOUT_FIELDS
+        )
+        for key in self._CUTOUT_FIELDS:
+            value = getattr(self, key, None)
+            if value is not None:
+                data[key] = base64.b64encode(value).decode("ascii")
+        return orjson.dumps(data)
+
+    @property
+    def _cutouts_loaded(self) -> bool:
+        """Whether all three cutouts are present, cached once True.
+
+        The hot path (plot_cutouts on an alert whose cutouts were
+        already fetched) then costs a single dict read instead of three
+        pydantic attribute accesses.
+        """
+        if self.__dict__.get("_cutouts_loaded_flag", False):
+            return True
+        loaded = (
+            self.cutoutScience is not None
+            and self.cutoutTemplate is not None
+            and self.cutoutDifference is not None
+        )
+        if loaded:
+            self.__dict__["_cutouts_loaded_flag"] = True
+        return loaded
+
+    def _ensure_photometry(self) -> None:
+        """Fetch photometry from the API if the alert carries none."""
+        raise NotImplementedError
+
+    def _photometry_sources(self) -> "tuple[list[Photometry] | None, ...]":
+        """Return the photometry lists carried by this alert."""
+        raise NotImplementedError
+
+    def _show_title(self, include_survey_matches: bool) -> str:
+        """Return the figure title used by show()."""
+        raise NotImplementedError
 
     def get_photometry(self, deduplicated: bool = True) -> list[Photometry]:
         """Combine and return all photometry data from the alert."""
+        self._ensure_photometry()
+        sources = self._photometry_sources()
+
+        # fast path: with a single non-empty source that is already
+        # sorted by jd (the shape the API returns), a shallow copy is
+        # all that is needed — no merge, no dedup hashing, no re-sort
+        single: list[Photometry] | None = None
+        non_empty = 0
+        for source in sources:
+            if source:
+                non_empty += 1
+                single = source
         if (
-            self.prv_candidates is None
-            and self.fp_hists is None
-            and self.prv_nondetections is None
+            non_empty == 1
+            and single is not None
+            and _is_sorted_jd(single, require_unique_keys=deduplicated)
         ):
-            from .api import get_photometry as get_photometry_from_api
+            return list(single)
 
-            photometry_data = get_photometry_from_api("ZTF", self.objectId)
-            self.prv_candidates = photometry_data.prv_candidates
-            self.fp_hists = photometry_data.fp_hists
-            self.prv_nondetections = photometry_data.prv_nondetections
-        photometry: list[Photometry] = []
-        # Add prv_candidates photometry
-        if self.prv_candidates:
-            photometry.extend(self.prv_candidates)
-        # Add fp_hists photometry if available
-        if self.fp_hists:
-            photometry.extend(self.fp_hists)
-        # Add prv_nondetections photometry
-        if self.prv_nondetections:
-            photometry.extend(self.prv_nondetections)
+        # if deduplicated, remove duplicates based on (jd, band) by keeping
+        # the first occurrence per key in a dict, then sort once; band is
+        # a Band enum member (a singleton with a cached hash), so the key
+        # hashes cheaply
+        if deduplicated:
+            merged: dict[tuple[float, Band], Photometry] = {}
+            for source in sources:
+                if source:
+                    for p in source:
+                        merged.setdefault((p.jd, p.band), p)
+            return sorted(merged.values(), key=_JD_KEY)
+
+        # one C-level concatenation over the non-empty sources rather
+        # than a Python-level extend per source
+        photometry = list(
+            chain.from_iterable(source for source in sources if source)
+        )
 
         # Sort photometry by Julian Date (jd)
-        photometry.sort(key=lambda x: x.jd)
-
-        # if deduplicated, remove duplicates based on (jd, band)
-        if deduplicated:
-            seen = set()
-            deduped_photometry = []
-            for p in photometry:
-                key = (p.jd, p.band)
-                if key not in seen:
-                    seen.add(key)
-                    deduped_photometry.append(p)
-            photometry = deduped_photometry
+        photometry.sort(key=_JD_KEY)
 
         return photometry
 
-    # `computed_field` makes it a property and includes it in schema/dumps
-    @computed_field
-    def survey(self) -> str:
-        return "ZTF"
+    def photometry_datetimes(self, deduplicated: bool = True) -> Any:
+        """Return the UTC datetimes of all photometry points.
 
-    @property
-    def drb(self) -> float | None:
-        """Return the reliability (DRB) score of the candidate, if available."""
-        return self.candidate.drb
+        All Julian dates are converted in a single vectorized astropy
+        Time call, which is much faster than accessing the per-point
+        Photometry.datetime property in a loop.
+        """
+        return photometry_jds_to_datetimes(
+            self.get_photometry(deduplicated=deduplicated)
+        )
+
+    def get_photometry_array(
+        self, deduplicated: bool = True
+    ) -> PhotometryArray:
+        """Columnar (structure-of-arrays) view of get_photometry."""
+        return PhotometryArray.from_list(
+            self.get_photometry(deduplicated=deduplicated)
+        )
 
     def plot_cutouts(
         self,
         orientation: str = "horizontal",
+        use_rotation: bool | None = None,
         axes: "list[Axes] | None" = None,
         show: bool = True,
         figsize: tuple[float, float] | None = None,
@@ -279,6 +512,9 @@ class ZtfAlert(EnrichedZtfAlert):
         ----------
         orientation : str, default='horizontal'
             Layout orientation: 'horizontal' or 'vertical'. (overwritten if axes is not None)
+        use_rotation : bool, optional
+            Whether to apply rotation based on FITS header (if available).
+            Defaults to True for LSST alerts and False for ZTF alerts.
         axes : list of matplotlib.axes.Axes, optional
             List of 3 axes to plot on. If None, creates new figure.
         show : bool, default=True
@@ -293,16 +529,16 @@ class ZtfAlert(EnrichedZtfAlert):
         list of matplotlib.axes.Axes
             List of the three axes objects (science, template, difference).
         """
-        if (
-            self.cutoutScience is None
-            or self.cutoutTemplate is None
-            or self.cutoutDifference is None
-        ):
+        if not self._cutouts_loaded:
             self.get_cutouts()
+        if use_rotation is None:
+            use_rotation = self._use_rotation_default
+        from .cutouts import plot_cutouts
+
         return plot_cutouts(
             self,
-            cast(str, self.survey),
-            False,
+            self.survey,
+            use_rotation,
             axes,
             show,
             orientation,
@@ -313,6 +549,7 @@ class ZtfAlert(EnrichedZtfAlert):
     def show_cutouts(
         self,
         orientation: str = "horizontal",
+        use_rotation: bool | None = None,
     ) -> None:
         """Display the cutouts in a new matplotlib figure.
 
@@ -320,8 +557,13 @@ class ZtfAlert(EnrichedZtfAlert):
         ----------
         orientation : str, default='horizontal'
             Layout orientation: 'horizontal' or 'vertical'.
+        use_rotation : bool, optional
+            Whether to apply rotation based on FITS header (if available).
+            Defaults to True for LSST alerts and False for ZTF alerts.
         """
-        self.plot_cutouts(orientation=orientation, show=True)
+        self.plot_cutouts(
+            orientation=orientation, use_rotation=use_rotation, show=True
+        )
 
     def get_cutouts(self) -> AlertCutouts:
         """Fetch cutouts for this alert from the API.
@@ -331,23 +573,23 @@ class ZtfAlert(EnrichedZtfAlert):
         AlertCutouts
             Cutout images (science, template, difference) as bytes.
         """
-        if (
-            self.cutoutScience is not None
-            and self.cutoutTemplate is not None
-            and self.cutoutDifference is not None
-        ):
+        if self._cutouts_loaded:
+            # _cutouts_loaded guarantees all three are present, which
+            # mypy cannot see through the cached flag
             return AlertCutouts(
                 candid=self.candid,
-                cutoutScience=self.cutoutScience,
-                cutoutTemplate=self.cutoutTemplate,
-                cutoutDifference=self.cutoutDifference,
+                cutoutScience=cast(bytes, self.cutoutScience),
+                cutoutTemplate=cast(bytes, self.cutoutTemplate),
+                cutoutDifference=cast(bytes, self.cutoutDifference),
             )
+        from .api import Survey
         from .api import get_cutouts as get_cutouts_from_api
 
-        cutouts = get_cutouts_from_api("ZTF", self.candid)
+        cutouts = get_cutouts_from_api(cast(Survey, self.survey), self.candid)
         self.cutoutScience = cutouts.cutoutScience
         self.cutoutTemplate = cutouts.cutoutTemplate
         self.cutoutDifference = cutouts.cutoutDifference
+        self.__dict__["_cutouts_loaded_flag"] = True
         return cutouts
 
     def get_cross_matches(self) -> CrossMatches | None:
@@ -360,9 +602,14 @@ class ZtfAlert(EnrichedZtfAlert):
         """
         if self.cross_matches is not None:
             return self.cross_matches
-        from .api import get_cross_matches as get_cross_matches_from_api
+        from .api import Survey
+        from .api import (
+            get_cross_matches as get_cross_matches_from_api,
+        )
 
-        self.cross_matches = get_cross_matches_from_api("ZTF", self.objectId)
+        self.cross_matches = get_cross_matches_from_api(
+            cast(Survey, self.survey), self.objectId
+        )
         return self.cross_matches
 
     def plot_lightcurve(
@@ -385,6 +632,90 @@ class ZtfAlert(EnrichedZtfAlert):
         show : bool, default=True
             Whether to call plt.show() after plotting.
         """
+        self._ensure_photometry()
+        from .lightcurves import plot_lightcurve
+
+        plot_lightcurve(
+            self,
+            include_survey_matches=include_survey_matches,
+            include_nondetections=include_nondetections,
+            ax=ax,
+            show=show,
+        )
+
+    def show_lightcurve(self) -> None:
+        """Display the lightcurve in a new matplotlib figure."""
+        self.plot_lightcurve(show=True)
+
+    def show(
+        self,
+        include_survey_matches: bool = True,
+        include_nondetections: bool = True,
+        orientation: str = "horizontal",
+        fig: "Figure | None" = None,
+        show: bool = True,
+    ) -> None:
+        """Display both cutouts and lightcurve for this alert.
+
+        If *fig* is provided, the figure is cleared and reused instead of
+        allocating a new one (useful when cycling through many alerts).
+        With show=False the figure is only drawn, letting callers grab
+        the rendered image themselves (e.g. to cache PNG bytes).
+        """
+        import matplotlib.pyplot as plt
+
+        # any unrecognized orientation falls back to vertical, matching
+        # the old non-"horizontal" branch
+        layout = _SHOW_LAYOUTS.get(orientation, _SHOW_LAYOUTS["vertical"])
+        if fig is None:
+            fig = plt.figure(figsize=layout["figsize"])
+        else:
+            fig.clear()
+            fig.set_size_inches(*layout["figsize"])
+        gs = fig.add_gridspec(
+            *layout["shape"],
+            width_ratios=layout["width_ratios"],
+            height_ratios=layout["height_ratios"],
+        )
+        cutout_axes = [fig.add_subplot(gs[cell]) for cell in layout["cutouts"]]
+        ax_lightcurve = fig.add_subplot(gs[layout["lightcurve"]])
+        self.plot_cutouts(
+            orientation=orientation, axes=cutout_axes, show=False
+        )
+        self.plot_lightcurve(
+            include_survey_matches=include_survey_matches,
+            include_nondetections=include_nondetections,
+            ax=ax_lightcurve,
+            show=False,
+        )
+        fig.suptitle(
+            self._show_title(include_survey_matches),
+            fontsize=16,
+            fontweight="bold",
+        )
+        fig.tight_layout()
+        if show:
+            plt.show()
+
+
+class ZtfAlert(AlertDisplayMixin, EnrichedZtfAlert):
+    """Pydantic model for a Babamul ZTF alert."""
+
+    model_config = {"defer_build": True}
+
+    topic: str | None = None
+    cross_matches: CrossMatches | None = None
+
+    # a plain Literal default stays in the schema and dumps, but reads as
+    # a cheap attribute rather than going through computed-field machinery
+    survey: Literal["ZTF"] = "ZTF"
+
+    @property
+    def drb(self) -> float | None:
+        """Return the reliability (DRB) score of the candidate, if available."""
+        return self.candidate.drb
+
+    def _ensure_photometry(self) -> None:
         if (
             self.prv_candidates is None
             and self.fp_hists is None
@@ -396,13 +727,19 @@ class ZtfAlert(EnrichedZtfAlert):
             self.prv_candidates = photometry_data.prv_candidates
             self.fp_hists = photometry_data.fp_hists
             self.prv_nondetections = photometry_data.prv_nondetections
-        plot_lightcurve(
-            self,
-            include_survey_matches=include_survey_matches,
-            include_nondetections=include_nondetections,
-            ax=ax,
-            show=show,
-        )
+
+    def _photometry_sources(self) -> "tuple[list[Photometry] | None, ...]":
+        return (self.prv_candidates, self.fp_hists, self.prv_nondetections)
+
+    def _show_title(self, include_survey_matches: bool) -> str:
+        title = f"{self.objectId}"
+        if (
+            include_survey_matches
+            and self.survey_matches
+            and self.survey_matches.lsst
+        ):
+            title += f" (LSST {self.survey_matches.lsst.objectId})"
+        return title
 
     def plot_cross_matches(
         self, ax: "Axes | None" = None, show: bool = True
@@ -413,30 +750,35 @@ class ZtfAlert(EnrichedZtfAlert):
             print("No cross-match information available.")
             return
         # we convert the cross-matches to a list of dicts, and then to a pandas DataFrame, so we can display it as a table
+        import matplotlib.pyplot as plt
         import pandas as pd
 
-        rows = []
-        for match in cross_matches.ned or []:
-            rows.append(
-                {
-                    "catalog": "NED",
-                    "objtype": match.objtype,
-                    "ra": match.ra,
-                    "dec": match.dec,
-                    "z": match.z,
-                    "distance_arcsec": match.distance_arcsec,
-                }
+        # list-of-tuples with explicit columns avoids per-row schema
+        # inference (and per-row key hashing) in the DataFrame constructor
+        columns = ("catalog", "objtype", "ra", "dec", "z", "distance_arcsec")
+        rows = [
+            (
+                "NED",
+                match.objtype,
+                match.ra,
+                match.dec,
+                match.z,
+                match.distance_arcsec,
             )
+            for match in cross_matches.ned
+        ]
         # skip the others for now
         if not rows:
             print("No cross-match information available.")
             return
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(rows, columns=columns)
         if ax is None:
             fig, ax = plt.subplots(figsize=(8, len(df) * 0.5 + 1))
         ax.axis("off")
         table = ax.table(
-            cellText=df.values.tolist(),
+            # matplotlib stringifies cell values itself; its stubs only
+            # accept Sequence[Sequence[str]]
+            cellText=rows,  # type: ignore[arg-type]
             colLabels=df.columns.tolist(),
             loc="center",
         )
@@ -446,293 +788,55 @@ class ZtfAlert(EnrichedZtfAlert):
         if show:
             plt.show()
 
-    def show_lightcurve(self) -> None:
-        """Display the lightcurve in a new matplotlib figure."""
-        self.plot_lightcurve(show=True)
 
-    def show(
-        self,
-        include_survey_matches: bool = True,
-        include_nondetections: bool = True,
-        orientation: str = "horizontal",
-    ) -> None:
-        """Display both cutouts and lightcurve for this alert."""
-        if orientation == "horizontal":
-            fig = plt.figure(figsize=(12, 6))
-            gs = fig.add_gridspec(
-                3, 2, width_ratios=[1, 2], height_ratios=[1, 1, 1]
-            )
-            ax1 = fig.add_subplot(gs[0, 0])
-            ax2 = fig.add_subplot(gs[1, 0])
-            ax3 = fig.add_subplot(gs[2, 0])
-            ax4 = fig.add_subplot(gs[:, 1])
-        else:
-            fig = plt.figure(figsize=(10, 10))
-            gs = fig.add_gridspec(
-                2, 3, width_ratios=[1, 1, 1], height_ratios=[1, 2]
-            )
-            ax1 = fig.add_subplot(gs[0, 0])
-            ax2 = fig.add_subplot(gs[0, 1])
-            ax3 = fig.add_subplot(gs[0, 2])
-            ax4 = fig.add_subplot(gs[1, :])
-        self.plot_cutouts(
-            orientation=orientation, axes=[ax1, ax2, ax3], show=False
-        )
-        self.plot_lightcurve(
-            include_survey_matches=include_survey_matches,
-            include_nondetections=include_nondetections,
-            ax=ax4,
-            show=False,
-        )
-        title = f"{self.objectId}"
-        if (
-            include_survey_matches
-            and self.survey_matches
-            and self.survey_matches.lsst
-        ):
-            title += f" (LSST {self.survey_matches.lsst.objectId})"
-        plt.suptitle(title, fontsize=16, fontweight="bold")
-        plt.tight_layout()
-        plt.show()
+def _candidate_datetime(self: Any) -> Any:
+    """Convert the candidate jd to a datetime, cached per instance.
+
+    jd never changes after validation, so the astropy Time construction
+    only has to run once per candidate.
+    """
+    cached = self.__dict__.get("_datetime_cache")
+    if cached is None:
+        cached = Time(self.jd, format="jd").to_datetime(timezone=timezone.utc)
+        self.__dict__["_datetime_cache"] = cached
+    return cached
 
 
 # Add datetime property to ZtfCandidate for convenience
 # Note: Mypy doesn't support dynamic property assignment, so we ignore this
-ZtfCandidate.datetime = property(  # type: ignore[attr-defined]
-    lambda self: Time(self.jd, format="jd").to_datetime(timezone=timezone.utc)
-)
+ZtfCandidate.datetime = property(_candidate_datetime)  # type: ignore[attr-defined]
 
 
-class LsstAlert(EnrichedLsstAlert):
+class LsstAlert(AlertDisplayMixin, EnrichedLsstAlert):
     """Pydantic model for a Babamul LSST alert."""
 
+    model_config = {"defer_build": True}
+
     topic: str | None = None
     cross_matches: CrossMatches | None = None
 
-    def get_photometry(self, deduplicated: bool = True) -> list[Photometry]:
-        """Combine and return all photometry data from the alert."""
-        if self.prv_candidates is None and self.fp_hists is None:
-            from .api import get_photometry as get_photometry_from_api
-
-            photometry_data = get_photometry_from_api("LSST", self.objectId)
-            self.prv_candidates = photometry_data.prv_candidates
-            self.fp_hists = photometry_data.fp_hists
-        photometry: list[Photometry] = []
-        # Add prv_candidates photometry
-        if self.prv_candidates:
-            photometry.extend(self.prv_candidates)
-        # Add fp_hists photometry if available
-        if self.fp_hists:
-            photometry.extend(self.fp_hists)
-
-        # Sort photometry by Julian Date (jd)
-        photometry.sort(key=lambda x: x.jd)
-
-        # if deduplicated, remove duplicates based on (jd, band)
-        if deduplicated:
-            seen = set()
-            deduped_photometry = []
-            for p in photometry:
-                key = (p.jd, p.band)
-                if key not in seen:
-                    seen.add(key)
-                    deduped_photometry.append(p)
-            photometry = deduped_photometry
-
-        return photometry
+    # LSST cutouts carry a ROTPA header, so rotate them by default
+    _use_rotation_default: ClassVar[bool] = True
 
-    # `computed_field` makes it a property and includes it in schema/dumps
-    @computed_field
-    def survey(self) -> str:
-        return "LSST"
+    survey: Literal["LSST"] = "LSST"
 
     @property
     def drb(self) -> float | None:
         """Return the reliability (DRB) score of the candidate, if available."""
         return self.candidate.reliability
 
-    def plot_cutouts(
-        self,
-        orientation: str = "horizontal",
-        use_rotation: bool = True,
-        axes: "list[Axes] | None" = None,
-        show: bool = True,
-        figsize: tuple[float, float] | None = None,
-        title: str | None = None,
-    ) -> "list[Axes]":
-        """Display the science, template, and difference cutouts for this alert.
-
-        Parameters
-        ----------
-        orientation : str, default='horizontal'
-            Layout orientation: 'horizontal' or 'vertical'. (overwritten if axes is not None)
-        use_rotation : bool, default=True
-            Whether to apply rotation based on FITS header (if available).
-        axes : list of matplotlib.axes.Axes, optional
-            List of 3 axes to plot on. If None, creates new figure.
-        show : bool, default=True
-            Whether to call plt.show() after plotting.
-        figsize : tuple, optional
-            Figure size. If None, uses defaults based on orientation.
-        title : str, optional
-            Overall figure title. If None, uses objectId.
-
-        Returns
-        -------
-        list of matplotlib.axes.Axes
-            List of the three axes objects (science, template, difference).
-        """
-        if (
-            self.cutoutScience is None
-            or self.cutoutTemplate is None
-            or self.cutoutDifference is None
-        ):
-            self.get_cutouts()
-        return plot_cutouts(
-            self,
-            cast(str, self.survey),
-            use_rotation,
-            axes,
-            show,
-            orientation,
-            figsize,
-            title or self.objectId,
-        )
-
-    def show_cutouts(
-        self,
-        orientation: str = "horizontal",
-        use_rotation: bool = True,
-    ) -> None:
-        """Display the cutouts in a new matplotlib figure.
-
-        Parameters
-        ----------
-        orientation : str, default='horizontal'
-            Layout orientation: 'horizontal' or 'vertical'.
-        use_rotation : bool, default=True
-            Whether to apply rotation based on FITS header (if available).
-        """
-        self.plot_cutouts(
-            use_rotation=use_rotation, orientation=orientation, show=True
-        )
-
-    def get_cutouts(self) -> AlertCutouts:
-        """Fetch cutouts for this alert from the API.
-
-        Returns
-        -------
-        AlertCutouts
-            Cutout images (science, template, difference) as bytes.
-        """
-        if (
-            self.cutoutScience is not None
-            and self.cutoutTemplate is not None
-            and self.cutoutDifference is not None
-        ):
-            return AlertCutouts(
-                candid=self.candid,
-                cutoutScience=self.cutoutScience,
-                cutoutTemplate=self.cutoutTemplate,
-                cutoutDifference=self.cutoutDifference,
-            )
-        from .api import get_cutouts as get_cutouts_from_api
-
-        cutouts = get_cutouts_from_api("LSST", self.candid)
-        self.cutoutScience = cutouts.cutoutScience
-        self.cutoutTemplate = cutouts.cutoutTemplate
-        self.cutoutDifference = cutouts.cutoutDifference
-        return cutouts
-
-    def get_cross_matches(self) -> CrossMatches | None:
-        """Fetch cross-matches for this alert from the API.
-
-        Returns
-        -------
-        CrossMatches | None
-            Cross-matches with other surveys, if available.
-        """
-        if self.cross_matches is not None:
-            return self.cross_matches
-
-        from .api import get_cross_matches as get_cross_matches_from_api
-
-        self.cross_matches = get_cross_matches_from_api("LSST", self.objectId)
-        return self.cross_matches
-
-    def plot_lightcurve(
-        self,
-        include_survey_matches: bool = True,
-        include_nondetections: bool = True,
-        ax: "Axes | None" = None,
-        show: bool = True,
-    ) -> None:
-        """Plot the lightcurve for this alert.
-
-        Parameters
-        ----------
-        include_survey_matches : bool, default=True
-            Whether to include photometry from survey matches.
-        include_nondetections : bool, default=True
-            Whether to include non-detection upper limits.
-        ax : matplotlib.axes.Axes, optional
-            Axis to plot on. If None, creates new figure.
-        show : bool, default=True
-            Whether to call plt.show() after plotting.
-        """
+    def _ensure_photometry(self) -> None:
         if self.prv_candidates is None and self.fp_hists is None:
             from .api import get_photometry as get_photometry_from_api
 
             photometry_data = get_photometry_from_api("LSST", self.objectId)
             self.prv_candidates = photometry_data.prv_candidates
             self.fp_hists = photometry_data.fp_hists
-        plot_lightcurve(
-            self,
-            include_survey_matches=include_survey_matches,
-            include_nondetections=include_nondetections,
-            ax=ax,
-            show=show,
-        )
 
-    def show_lightcurve(self) -> None:
-        """Display the lightcurve in a new matplotlib figure."""
-        self.plot_lightcurve(show=True)
-
-    def show(
-        self,
-        include_survey_matches: bool = True,
-        include_nondetections: bool = True,
-        orientation: str = "horizontal",
-    ) -> None:
-        """Display both cutouts and lightcurve for this alert."""
-        if orientation == "horizontal":
-            fig = plt.figure(figsize=(12, 6))
-            gs = fig.add_gridspec(
-                3, 2, width_ratios=[1, 2], height_ratios=[1, 1, 1]
-            )
-            ax1 = fig.add_subplot(gs[0, 0])
-            ax2 = fig.add_subplot(gs[1, 0])
-            ax3 = fig.add_subplot(gs[2, 0])
-            ax4 = fig.add_subplot(gs[:, 1])
-        else:
-            fig = plt.figure(figsize=(10, 10))
-            gs = fig.add_gridspec(
-                2, 3, width_ratios=[1, 1, 1], height_ratios=[1, 2]
-            )
-            ax1 = fig.add_subplot(gs[0, 0])
-            ax2 = fig.add_subplot(gs[0, 1])
-            ax3 = fig.add_subplot(gs[0, 2])
-            ax4 = fig.add_subplot(gs[1, :])
-        self.plot_cutouts(
-            orientation=orientation, axes=[ax1, ax2, ax3], show=False
-        )
-        self.plot_lightcurve(
-            include_survey_matches=include_survey_matches,
-            include_nondetections=include_nondetections,
-            ax=ax4,
-            show=False,
-        )
+    def _photometry_sources(self) -> "tuple[list[Photometry] | None, ...]":
+        return (self.prv_candidates, self.fp_hists)
 
+    def _show_title(self, include_survey_matches: bool) -> str:
         title = f"LSST {self.objectId}"
         if (
             include_survey_matches
@@ -740,16 +844,12 @@ class LsstAlert(EnrichedLsstAlert):
             and self.survey_matches.ztf
         ):
             title += f" ({self.survey_matches.ztf.objectId})"
-        plt.suptitle(title, fontsize=16, fontweight="bold")
-        plt.tight_layout()
-        plt.show()
+        return title
 
 
 # Add datetime property to LsstCandidate for convenience
 # Note: Mypy doesn't support dynamic property assignment, so we ignore this
-LsstCandidate.datetime = property(  # type: ignore[attr-defined]
-    lambda self: Time(self.jd, format="jd").to_datetime(timezone=timezone.utc)
-)
+LsstCandidate.datetime = property(_candidate_datetime)  # type: ignore[attr-defined]
 
 
 def add_cross_matches(
@@ -758,32 +858,54 @@ def add_cross_matches(
     """Helper function to add cross-matches to a list of alerts."""
     from .api import get_cross_matches_bulk
 
-    # group and fetch cross-matches in bulk for efficiency, per survey
-    ztf_object_ids = [
-        a.objectId
-        for a in alerts
-        if isinstance(a, ZtfAlert) and a.cross_matches is None
-    ]
-    ztf_cross_matches = get_cross_matches_bulk(
-        "ZTF", ztf_object_ids, n_threads=n_threads
-    )
-
-    lsst_object_ids = [
-        a.objectId
-        for a in alerts
-        if isinstance(a, LsstAlert) and a.cross_matches is None
-    ]
-    lsst_cross_matches = get_cross_matches_bulk(
-        "LSST", lsst_object_ids, n_threads=n_threads
-    )
-
-    # assign cross-matches back to alerts
+    # group alerts per survey in a single pass; type() is avoids the MRO
+    # walk isinstance does and alerts that already have cross-matches are
+    # left untouched
+    ztf_alerts: list[ZtfAlert] = []
+    lsst_alerts: list[LsstAlert] = []
     for alert in alerts:
-        if isinstance(alert, ZtfAlert):
-            alert.cross_matches = ztf_cross_matches.get(
-                alert.objectId, CrossMatches()
+        alert_type = type(alert)
+        if alert_type is ZtfAlert and alert.cross_matches is None:
+            ztf_alerts.append(cast(ZtfAlert, alert))
+        elif alert_type is LsstAlert and alert.cross_matches is None:
+            lsst_alerts.append(cast(LsstAlert, alert))
+
+    # fetch cross-matches in bulk for efficiency, per survey; the two
+    # surveys are independent network calls, so run them concurrently
+    ztf_cross_matches: dict[str, CrossMatches] = {}
+    lsst_cross_matches: dict[str, CrossMatches] = {}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ztf_future = (
+            executor.submit(
+                get_cross_matches_bulk,
+                "ZTF",
+                [a.objectId for a in ztf_alerts],
+                n_threads=n_threads,
             )
-        elif isinstance(alert, LsstAlert):
-            alert.cross_matches = lsst_cross_matches.get(
-                alert.objectId, CrossMatches()
+            if ztf_alerts
+            else None
+        )
+        lsst_future = (
+            executor.submit(
+                get_cross_matches_bulk,
+                "LSST",
+                [a.objectId for a in lsst_alerts],
+                n_threads=n_threads,
             )
+            if lsst_alerts
+            else None
+        )
+        if ztf_future is not None:
+            ztf_cross_matches = ztf_future.result()
+        if lsst_future is not None:
+            lsst_cross_matches = lsst_future.result()
+
+    # assign cross-matches back to alerts
+    for alert in ztf_alerts:
+        alert.cross_matches = ztf_cross_matches.get(
+            alert.objectId, CrossMatches()
+        )
+    for alert in lsst_alerts:
+        alert.cross_matches = lsst_cross_matches.get(
+            alert.objectId, CrossMatches()
+        )
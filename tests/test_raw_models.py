@@ -0,0 +1,113 @@
+"""Tests for the trusted fast-construction paths of Photometry.
+
+The from_* constructors skip pydantic validation by default and the
+from_*_many batch variants vectorize the magnitude math; both must stay
+interchangeable with the strict (fully validated) path. These tests
+pin that contract so drift in the field list or the kernels surfaces
+here rather than in downstream consumers.
+"""
+
+import math
+from typing import Any
+
+import pytest
+
+from babamul.raw_models import LSST_ZP, ZTF_ZP, Photometry
+
+ALERT_SAMPLES: list[dict[str, Any]] = [
+    {
+        "jd": 2460500.5,
+        "psfFlux": 2500.0,
+        "psfFluxErr": 120.0,
+        "band": "g",
+        "ra": 150.123456,
+        "dec": 30.654321,
+    },
+    {
+        "jd": 2460501.5,
+        "psfFlux": -800.0,
+        "psfFluxErr": 95.0,
+        "band": "r",
+        "ra": 150.123457,
+        "dec": 30.654322,
+    },
+]
+
+NON_DETECTION_SAMPLES: list[dict[str, Any]] = [
+    {"jd": 2460499.5, "psfFluxErr": 150.0, "band": "g"},
+    {"jd": 2460499.7, "psfFluxErr": 210.0, "band": "i"},
+]
+
+# One row above and one below the SNR threshold, to exercise both the
+# magnitude and the upper-limit branches of the forced-photometry path
+FORCED_SAMPLES: list[dict[str, Any]] = [
+    {"jd": 2460500.1, "psfFlux": 3000.0, "psfFluxErr": 100.0, "band": "r"},
+    {"jd": 2460500.2, "psfFlux": 50.0, "psfFluxErr": 100.0, "band": "r"},
+]
+
+CASES = [
+    ("alert_photometry", ALERT_SAMPLES),
+    ("non_detection_photometry", NON_DETECTION_SAMPLES),
+    ("forced_photometry", FORCED_SAMPLES),
+]
+
+
+def assert_dumps_close(a: dict[str, Any], b: dict[str, Any]) -> None:
+    """Assert two Photometry dumps match, allowing float rounding.
+
+    The scalar constructors use math.log10 while the batch kernels go
+    through NumPy's vectorized log10, which may differ in the last ulp.
+    """
+    assert a.keys() == b.keys()
+    for key, va in a.items():
+        vb = b[key]
+        if isinstance(va, float) and isinstance(vb, float):
+            assert math.isclose(va, vb, rel_tol=1e-12), (key, va, vb)
+        else:
+            assert va == vb, (key, va, vb)
+
+
+@pytest.mark.parametrize(("kind", "samples"), CASES)
+@pytest.mark.parametrize("survey_zp", [ZTF_ZP, LSST_ZP])
+def test_fast_path_matches_strict(
+    kind: str, samples: list[dict[str, Any]], survey_zp: float
+) -> None:
+    """The default trusted path must dump identically to strict=True."""
+    scalar = getattr(Photometry, f"from_{kind}")
+    for sample in samples:
+        fast = scalar(sample, survey_zp)
+        strict = scalar(sample, survey_zp, strict=True)
+        assert_dumps_close(fast.model_dump(), strict.model_dump())
+
+
+@pytest.mark.parametrize("survey_zp", [ZTF_ZP, LSST_ZP])
+def test_from_tuple_matches_alert_photometry(survey_zp: float) -> None:
+    """The positional _from_tuple path must match the dict constructor."""
+    for sample in ALERT_SAMPLES:
+        row = (
+            sample["jd"],
+            sample["psfFlux"],
+            sample["psfFluxErr"],
+            sample["band"],
+            sample["ra"],
+            sample["dec"],
+        )
+        from_tuple = Photometry._from_tuple(row, survey_zp)
+        from_dict = Photometry.from_alert_photometry(sample, survey_zp)
+        assert_dumps_close(from_tuple.model_dump(), from_dict.model_dump())
+
+
+@pytest.mark.parametrize(("kind", "samples"), CASES)
+@pytest.mark.parametrize("survey_zp", [ZTF_ZP, LSST_ZP])
+def test_batch_matches_scalar(
+    kind: str, samples: list[dict[str, Any]], survey_zp: float
+) -> None:
+    """The vectorized from_*_many variants must match the scalar path."""
+    scalar = getattr(Photometry, f"from_{kind}")
+    batch = getattr(Photometry, f"from_{kind}_many")
+    results = batch(samples, survey_zp)
+    assert len(results) == len(samples)
+    for sample, result in zip(samples, results, strict=True):
+        assert_dumps_close(
+            result.model_dump(), scalar(sample, survey_zp).model_dump()
+        )